@@ -10,15 +10,19 @@ import sys
 import time
 import signal
 import socket
+import queue
 import logging
+import threading
 
+from functools import lru_cache
 from math import asin, cos, radians, sin, sqrt
-from typing import Union, NamedTuple
+from typing import Callable, Tuple, Union, NamedTuple
 from datetime import datetime, timedelta
 from urllib.parse import urlparse
 from urllib3.util import Retry
 
 import epaper
+import orjson
 import requests
 import slack_sdk
 import sentry_sdk
@@ -30,11 +34,25 @@ from PIL import Image, ImageDraw, ImageFont
 LOGLEVEL = os.getenv("LOGLEVEL", "INFO").upper()
 PATH_ROOT = os.path.dirname(os.path.realpath(__file__))
 SENTRY_DSN = os.getenv("SENTRY_DSN")
+SENTRY_TRACES_SAMPLE_RATE = os.getenv("SENTRY_TRACES_SAMPLE_RATE", "0.0")
 PIAWARE_HOST = os.getenv("PIAWARE_HOST", "http://127.0.0.1:8080")
 PIAWARE_BACKOFF = os.getenv("PIAWARE_BACKOFF", "1.0")
 PIAWARE_RETRIES = os.getenv("PIAWARE_RETRIES", "10")
+PIAWARE_TIMEOUT = os.getenv("PIAWARE_TIMEOUT", "5")
 FLIGHTRADAR_HOST = os.getenv("FLIGHTRADAR_HOST", "http://127.0.0.1:8754")
 RUNNING_IN_DOCKER = os.path.exists("/.dockerenv")
+SIGNAL_NAMES = {int(s): s.name for s in signal.Signals}
+RECEIVER_POSITION_TTL = 3600
+BUTTON_PINS = (5, 6, 13, 19)
+SAVE_SNAPSHOT_EVERY = os.getenv("SAVE_SNAPSHOT_EVERY", "1")
+if not SAVE_SNAPSHOT_EVERY.strip().isdigit():
+    # Logger Method, not `logging.warning()`: that would configure the Root
+    # Logger before `setup()` gets to call `logging.basicConfig()`
+    logging.getLogger().warning(
+        "Invalid SAVE_SNAPSHOT_EVERY '%s' - Resetting to '1'.", SAVE_SNAPSHOT_EVERY
+    )
+    SAVE_SNAPSHOT_EVERY = "1"
+SAVE_SNAPSHOT_EVERY = int(SAVE_SNAPSHOT_EVERY)
 EMERGENCY_SQUAWK = {
     "7500": "Unlawful interference (hijacking)",
     "7600": "Aircraft has lost verbal communication",
@@ -55,6 +73,10 @@ ICAO_OF_SPECIAL_INTEREST = {
 REGISTRATION_OF_SPECIAL_INTEREST = {
     # 'A7BHN': 'QTR85 Qatar DUS (REG)'
 }
+ICAO_WATCHLIST = {k.upper(): v for k, v in ICAO_OF_SPECIAL_INTEREST.items()}
+REGISTRATION_WATCHLIST = {
+    k.upper(): v for k, v in REGISTRATION_OF_SPECIAL_INTEREST.items()
+}
 
 
 class Position(NamedTuple):
@@ -66,6 +88,19 @@ class Position(NamedTuple):
     longitude: float
 
 
+class AircraftScan(NamedTuple):
+    """
+    Everything the Display needs from a single aircraft.json (see `PiAware.scan`)
+    """
+
+    count_all: int
+    count_pos: int
+    count_mlat: int
+    min_range: float
+    max_range: float
+    emergencies: Union[list, None]
+
+
 class PiAware:
     """
     PiAware Status e-Paper Module
@@ -74,10 +109,43 @@ class PiAware:
     receiver_position = None
     """ Own Receiver Position """
 
+    receiver_position_expires = 0.0
+    """ Time (monotonic) after which the Receiver Position is fetched again """
+
+    local_ip = None
+    """ Own (Display) IP Address """
+
+    session = requests.Session()
+    """ Shared HTTP Session (keeps Connections to PiAware / FR24 alive) """
+
+    responses = {}
+    """ Last Response per URL with ETag / Last-Modified (Conditional Requests) """
+
+    buttons = queue.Queue()
+    """ GPIO Pins of pressed Buttons (handled by the Main Thread) """
+
+    epd = None
+    """ e-Paper Display Handle (created once, re-initialized after Sleep) """
+
+    epd_sleeping = True
+    """ Whether the e-Paper Display needs `init()` before the next Use """
+
+    button_handlers = {}
+    """ GPIO Pin -> (Description, Action) of the Display Buttons """
+
+    updating_display = False
+    """ Whether `refresh()` is writing to the e-Paper Display right now """
+
+    shutdown_requested = False
+    """ Set to leave `process()` once the running Refresh is done """
+
     class Helpers:
         @staticmethod
         def trim(string: str) -> str:
             """Trim a String (remove leading/trailing spaces)"""
+            if isinstance(string, str):
+                return string.strip()
+
             return str(string).strip()
 
         @staticmethod
@@ -98,11 +166,6 @@ class PiAware:
 
             raise ValueError(f'Value "{needle}" unsupported. Supported: {haystack}')
 
-        @staticmethod
-        def contains_any(needle: str, haystack: list):
-            """Check if `haystack` contains `needle`, compared in UPPER case"""
-            return any(element.upper() == needle.upper() for element in haystack)
-
         @staticmethod
         def bool_from_env(needle: str = "HOME") -> bool:
             """Build a Boolean from an Environment Variable"""
@@ -116,20 +179,59 @@ class PiAware:
             try:
                 result = urlparse(url)
                 return all([result.scheme, result.netloc])
-            except:
+            except (TypeError, ValueError):
                 return False
 
         @staticmethod
         def to_kilometers(meters: float, decimals: int = 2) -> float:
             return round(float(meters) / 1000, decimals)
 
+        @staticmethod
+        @lru_cache(maxsize=1)
+        def load_fonts() -> Tuple[ImageFont.FreeTypeFont, ImageFont.FreeTypeFont]:
+            """Load the (small, medium) Display Fonts once and keep them"""
+            font_path = os.path.join(PATH_ROOT, "epaper.ttf")
+
+            return ImageFont.truetype(font_path, 11), ImageFont.truetype(font_path, 12)
+
+        @staticmethod
+        @lru_cache(maxsize=1)
+        def load_template(size: Tuple[int, int]) -> Image.Image:
+            """
+            Render the static Display Layout (Dividers, Section Headers) once
+
+            Callers must `copy()` the returned Image before drawing on it.
+            """
+            font_s, _ = PiAware.Helpers.load_fonts()
+
+            template = Image.new("1", size, 255)
+            draw = ImageDraw.Draw(template)
+
+            draw.line((0, 88, 264, 88), fill=0)
+            draw.line((132, 88, 132, 176), fill=0)
+
+            draw.text((4, 90), "Aircrafts", font=font_s, fill=0)
+            draw.text((136, 90), "Receiver OS", font=font_s, fill=0)
+
+            return template
+
         @staticmethod
         def get_local_ip():
+            """
+            Return the IP Address of the outgoing Interface
+
+            Once found it's kept for the Runtime of the Script, the Fallback
+            (127.0.0.1) is not kept so the next Call tries again.
+            """
+            if PiAware.local_ip is not None:
+                return PiAware.local_ip
+
             s = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
             try:
                 s.connect(("192.168.255.255", 1))
                 IP = s.getsockname()[0]
-            except:
+                PiAware.local_ip = IP
+            except OSError:
                 IP = "127.0.0.1"
             finally:
                 s.close()
@@ -137,11 +239,11 @@ class PiAware:
             return IP
 
         @staticmethod
-        def haversine_distance(
-            pos1: Position, pos2: Position, radius: float = 6371.0e3
-        ) -> float:
+        def haversine_from(
+            origin: Position, radius: float = 6371.0e3
+        ) -> Callable[[float, float], float]:
             """
-            Calculate the distance between two points on a sphere (e.g. Earth).
+            Calculate distances on a sphere (e.g. Earth) from a fixed origin.
             If no radius is provided then the default Earth radius, in meters, is
             used.
 
@@ -151,62 +253,165 @@ class PiAware:
 
             `Reference <https://en.wikipedia.org/wiki/Haversine_formula>`_
 
-            :param pos1: a Position tuple defining (lat, lon) in decimal degrees
-            :param pos2: a Position tuple defining (lat, lon) in decimal degrees
-            :param radius: radius of sphere in meters.
+            Returns a Function taking (lat, lon) in decimal degrees and returning
+            the Distance to `origin` in the unit of `radius`. Radians and Cosine
+            of the Origin are computed once instead of for every Aircraft.
+            """
+            hav_to = PiAware.Helpers.haversine_hav_from(origin)
+
+            def distance_to(lat: float, lon: float) -> float:
+                return PiAware.Helpers.hav_to_distance(hav_to(lat, lon), radius)
+
+            return distance_to
 
-            :returns: distance between two points in meters.
-            :rtype: float
+        @staticmethod
+        def haversine_hav_from(origin: Position) -> Callable[[float, float], float]:
             """
-            lat1, lon1, lat2, lon2 = [radians(x) for x in (*pos1, *pos2)]
+            Haversine of the central Angle between (lat, lon) and `origin`
 
-            hav = (
-                sin((lat2 - lat1) / 2.0) ** 2
-                + cos(lat1) * cos(lat2) * sin((lon2 - lon1) / 2.0) ** 2
-            )
-            distance = 2 * radius * asin(sqrt(hav))
+            The Distance is strictly increasing in this Value, so it can be used
+            to rank Points (e.g. Min / Max) before converting only the Results
+            with `hav_to_distance`.
+            """
+            lat0, lon0 = radians(origin.latitude), radians(origin.longitude)
+            cos_lat0 = cos(lat0)
+
+            def hav_to(lat: float, lon: float) -> float:
+                lat, lon = radians(lat), radians(lon)
+
+                return (
+                    sin((lat - lat0) / 2.0) ** 2
+                    + cos_lat0 * cos(lat) * sin((lon - lon0) / 2.0) ** 2
+                )
+
+            return hav_to
 
-            return distance
+        @staticmethod
+        def hav_to_distance(hav: float, radius: float = 6371.0e3) -> float:
+            """Turn a Haversine (see `haversine_hav_from`) into a Distance"""
+            return 2 * radius * asin(sqrt(hav))
 
         @staticmethod
-        def download(
-            url: str, retry: int = None, backoff: float = None, bust: bool = True
-        ) -> Union[requests.Response, bool]:
-            """Download File through Requests (mainly used with json)"""
+        def mount_adapter(url: str, retry: int, backoff: float) -> None:
+            """
+            Mount a pooled HTTP Adapter with Retries for the Host of `url`
+
+            Must happen in `setup()`, before any Worker Thread uses the Session:
+            `mount()` reorders the Adapters other Threads may be looking up.
+            """
+            parsed_url = urlparse(url)
+            url_prefix = f"{parsed_url.scheme}://{parsed_url.netloc}"
+
+            PiAware.session.mount(
+                url_prefix,
+                HTTPAdapter(
+                    pool_connections=4,
+                    pool_maxsize=8,
+                    max_retries=Retry(total=retry, backoff_factor=backoff),
+                ),
+            )
+
+        @staticmethod
+        def download(url: str, bust: bool = True) -> Union[requests.Response, bool]:
+            """
+            Download File through Requests (mainly used with json)
+
+            Retries are configured per Host (see `mount_adapter`). Requests
+            are conditional if the last Response for `url` had an
+            ETag or Last-Modified Header; on "304 Not Modified" that previous
+            Response is returned again.
+            """
 
             if not PiAware.Helpers.is_valid_url(url):
                 raise RuntimeError(f"URL {url} is invalid")
 
-            session = requests.Session()
-
             if bust is True:
-                cache_bust = {"ts": time.time()}
+                headers = {"Cache-Control": "no-cache"}
             else:
-                cache_bust = None
+                headers = {}
 
-            if retry is None:
-                retry = int(PIAWARE_RETRIES)
-
-            if backoff is None:
-                backoff = float(PIAWARE_BACKOFF)
-
-            session.mount(
-                PIAWARE_HOST,
-                HTTPAdapter(max_retries=Retry(total=retry, backoff_factor=backoff)),
-            )
+            previous = PiAware.responses.get(url)
+            if previous is not None:
+                if "ETag" in previous.headers:
+                    headers["If-None-Match"] = previous.headers["ETag"]
+                if "Last-Modified" in previous.headers:
+                    headers["If-Modified-Since"] = previous.headers["Last-Modified"]
 
             try:
-                content = session.get(url, params=cache_bust)
+                content = PiAware.session.get(
+                    url, headers=headers, timeout=(3.0, float(PIAWARE_TIMEOUT))
+                )
+
+                if content.status_code == 304 and previous is not None:
+                    return previous
+                elif content.status_code == 200:
+                    if "ETag" in content.headers or "Last-Modified" in content.headers:
+                        PiAware.responses[url] = content
 
-                if content.status_code == 200:
                     return content
                 else:
                     return False
-            except Exception as e:
+            except requests.exceptions.RequestException as e:
                 logging.error('Error GETing "%s" (error: %s)', url, str(e))
 
                 return False
 
+        @staticmethod
+        def download_json(url: str, bust: bool = True) -> dict:
+            """Download and parse a JSON Document, empty on Error (see `download`)"""
+            r = PiAware.Helpers.download(url, bust)
+
+            if r is not False:
+                return PiAware.Helpers.parse_json(r)
+
+            return {}
+
+        @staticmethod
+        def parse_json(response: requests.Response) -> dict:
+            """Parse a JSON Response Body (using orjson), empty on Error"""
+            try:
+                return orjson.loads(response.content)
+            except orjson.JSONDecodeError as e:
+                logging.error(
+                    'Error parsing JSON from "%s" (error: %s)', response.url, str(e)
+                )
+
+                return {}
+
+        @staticmethod
+        def fetch_concurrently(*calls: Callable) -> list:
+            """
+            Run `calls` on Daemon Threads and return their Results in Order
+
+            Daemon Threads don't hold up the Interpreter's Exit, so a Shutdown
+            during the Fetch doesn't wait for pending HTTP Retries to run out.
+            An Exception raised by a Call is raised again here.
+            """
+            results, errors = [None] * len(calls), [None] * len(calls)
+
+            def run(index: int, call: Callable) -> None:
+                try:
+                    results[index] = call()
+                except Exception as e:
+                    errors[index] = e
+
+            threads = [
+                threading.Thread(target=run, args=(index, call), daemon=True)
+                for index, call in enumerate(calls)
+            ]
+
+            for thread in threads:
+                thread.start()
+
+            for thread in threads:
+                thread.join()
+
+            for error in errors:
+                if error is not None:
+                    raise error
+
+            return results
+
         @staticmethod
         def send_slack_notification(
             icao_reg: str,
@@ -214,8 +419,14 @@ class PiAware:
             squawk: str,
             distance: str,
             mode: str = "emergency",
+            remarks: str = None,
         ) -> bool:
-            """Send a Slack Notification"""
+            """
+            Send a Slack Notification
+
+            `remarks` describe a Registration / ICAO of Special Interest, they
+            are looked up (case-insensitive) if not given.
+            """
 
             slack_token = os.getenv("SLACK_BOT_TOKEN")
             slack_channel = os.getenv("SLACK_CHANNEL")
@@ -240,11 +451,15 @@ class PiAware:
                         header_block = (
                             f"Registration of Special Interest on {piaware_host}"
                         )
-                        description_block = REGISTRATION_OF_SPECIAL_INTEREST[callsign]
+                        description_block = remarks or REGISTRATION_WATCHLIST.get(
+                            callsign.upper(), ""
+                        )
                     else:
                         summary = f"Flight of Special Interest {callsign}"
                         header_block = f"Flight of Special Interest on {piaware_host}"
-                        description_block = ICAO_OF_SPECIAL_INTEREST[icao_reg]
+                        description_block = remarks or ICAO_WATCHLIST.get(
+                            icao_reg.upper(), ""
+                        )
 
                     if str(distance).lower() == "unknown":
                         distance_field = distance
@@ -293,59 +508,72 @@ class PiAware:
             else:
                 return False
 
-        @staticmethod
-        def distance(
-            origin: Position, mode: str = "max", threshold: int = 120
-        ) -> float:
-            PiAware.Helpers.check_supported(mode, ["min", "max"])
-
-            aircrafts = PiAware.get_aircrafts(raw=True)
-            if mode == "max":
-                aircraft_range = 0
-            else:
-                aircraft_range = sys.maxsize
+    @staticmethod
+    def __button_callback(pin: int) -> Callable[[int], None]:
+        """
+        Build the RPi.GPIO Callback of a single Button Pin
 
-            for aircraft in aircrafts["aircraft"]:
-                if {"lat", "lon", "seen_pos"}.issubset(aircraft):
-                    if aircraft["seen_pos"] <= threshold:
-                        distance = PiAware.Helpers.haversine_distance(
-                            origin, Position(aircraft["lat"], aircraft["lon"])
-                        )
-                        if mode == "max":
-                            if distance > aircraft_range:
-                                aircraft_range = distance
-                        else:
-                            if distance < aircraft_range:
-                                aircraft_range = distance
+        Whether `pin` has a Handler is decided once here: Pins without one
+        get a Callback that only logs their Events.
+        """
+        if pin not in PiAware.button_handlers:
 
-            logging.info(
-                "%s Aircraft Distance: %s km",
-                PiAware.Helpers.ucfirst(mode),
-                PiAware.Helpers.to_kilometers(aircraft_range, 2),
-            )
+            def ignore(channel: int) -> None:
+                logging.warning("Ignoring Event on unexpected Pin %s.", channel)
+
+            return ignore
+
+        last_edge = 0
+
+        def process_interrupt(channel: int) -> None:
+            nonlocal last_edge
+
+            now = time.monotonic_ns()
+            previous, last_edge = last_edge, now
+
+            if now - previous < 50_000_000:
+                return
 
-            return aircraft_range
+            # bouncetime only masks further Edges, it doesn't debounce: re-sample
+            # the Pin and drop the Event unless the Button is still pressed
+            time.sleep(0.05)
+            if GPIO.input(pin) != GPIO.LOW:
+                logging.debug("Ignoring Event on Pin %s (Pin not low anymore).", pin)
+                return
+
+            # Runs on the RPi.GPIO Thread: only hand the Pin over, the Action
+            # itself is run by the Main Thread (see `__wait_for_buttons()`)
+            PiAware.buttons.put(pin)
+
+        return process_interrupt
 
     @staticmethod
-    def __process_interrupt(channel: int) -> None:
-        if channel == 5:
-            logging.info(
-                "Received Event on Pin %s - Clearing Display (Black).", channel
-            )
-            PiAware.__clear(clear=True, sleep=False, display_color=0x00)
-        elif channel == 6:
-            logging.info(
-                "Received Event on Pin %s - Clearing Display (White).", channel
-            )
-            PiAware.__clear(clear=True, sleep=False, display_color=0xFF)
-        elif channel == 13:
-            logging.info("Received Event on Pin %s - Executing Refresh.", channel)
-            PiAware.refresh(cycle=0)
-        elif channel == 19:
-            logging.info("Received Event on Pin %s - Executing Shutdown.", channel)
-            PiAware.__shutdown(signal_number=15)
-        else:
-            raise ValueError("Unexpected Pin: %s", channel)
+    def __wait_for_buttons(timeout: float) -> bool:
+        """
+        Run the Actions of pressed Buttons for up to `timeout` Seconds.
+        Returns True as soon as an Action returns True (ends the Wait early).
+        """
+        deadline = time.monotonic() + timeout
+
+        while True:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return False
+
+            try:
+                channel = PiAware.buttons.get(timeout=remaining)
+            except queue.Empty:
+                return False
+
+            description, action = PiAware.button_handlers[channel]
+            logging.info("Received Event on Pin %s - %s.", channel, description)
+
+            if action() is True:
+                return True
+
+            if PiAware.shutdown_requested:
+                logging.info("Shutting down after Event on Pin %s.", channel)
+                sys.exit(0)
 
     @staticmethod
     def __process_shutdown_signal(signal_number: int, frame) -> None:
@@ -353,65 +581,94 @@ class PiAware:
 
     @staticmethod
     def __shutdown(signal_number: int) -> None:
-        signal_name = signal.Signals(signal_number).name
+        signal_name = SIGNAL_NAMES.get(signal_number, str(signal_number))
 
         if signal_name == "SIGHUP":
             logging.info("Received %s, ignoring.", signal_name)
             return
 
+        if PiAware.updating_display and not PiAware.shutdown_requested:
+            # Don't interrupt a Display Update half way, `process()` exits
+            # after the Refresh. A second Signal shuts down immediately.
+            logging.info(
+                "Received Signal %s (%s), shutting down after the Display Update.",
+                signal_number,
+                signal_name,
+            )
+            PiAware.shutdown_requested = True
+            return
+
         logging.info("Shutting down on Signal %s (%s).", signal_number, signal_name)
 
+        # Only unwind here, Display and GPIO are cleaned up by `process()`
+        sys.exit(0)
+
+    @staticmethod
+    def __cleanup() -> None:
         PiAware.__clear(clear=True, sleep=True)
         GPIO.cleanup()
         GPIO.setmode(GPIO.BCM)
 
-        logging.info("Shutdown on Signal %s complete.", signal_name)
-        sys.exit(0)
+        logging.info("Shutdown complete.")
 
     @staticmethod
     def __clear(
         clear: bool = False, sleep: bool = False, display_color: int = 0xFF
     ) -> epaper.epaper:
-        epd = epaper.epaper("epd2in7").EPD()
-        epd.init()
+        # Signals wait for the Display Write (see `__shutdown()`), the Flag
+        # is restored as `refresh()` keeps it set until the Display sleeps
+        updating_display = PiAware.updating_display
+        PiAware.updating_display = True
 
-        if clear:
-            if display_color not in [0x00, 0xFF]:
-                logging.warning(
-                    "Got invalid Display Color: '%s' - Resetting to '0xFF'.",
-                    display_color,
-                )
-                display_color = 0xFF
+        try:
+            if PiAware.epd is None:
+                PiAware.epd = epaper.epaper("epd2in7").EPD()
 
-            epd.Clear(display_color)
+            epd = PiAware.epd
 
-        if sleep:
-            epd.sleep()
+            if PiAware.epd_sleeping:
+                epd.init()
+                PiAware.epd_sleeping = False
+
+            if clear:
+                if display_color not in [0x00, 0xFF]:
+                    logging.warning(
+                        "Got invalid Display Color: '%s' - Resetting to '0xFF'.",
+                        display_color,
+                    )
+                    display_color = 0xFF
+
+                epd.Clear(display_color)
+
+            if sleep:
+                epd.sleep()
+                PiAware.epd_sleeping = True
+        finally:
+            PiAware.updating_display = updating_display
 
         return epd
 
     @staticmethod
-    def __process_special_interest(aircraft: list) -> None:
+    def __process_special_interest(
+        aircraft: list, distance_to: Callable[[float, float], float]
+    ) -> None:
         """
         Process Flights of Special Interest
+
+        `distance_to` calculates the Distance to the own Receiver (see
+        `Helpers.haversine_from`).
         """
 
-        if "flight" in aircraft and len(REGISTRATION_OF_SPECIAL_INTEREST) >= 1:
+        if "flight" in aircraft:
             flight = PiAware.Helpers.trim(aircraft["flight"])
+            remarks = REGISTRATION_WATCHLIST.get(flight.upper())
 
-            contains_registration = PiAware.Helpers.contains_any(
-                flight, list(REGISTRATION_OF_SPECIAL_INTEREST.keys())
-            )
-
-            if contains_registration is True:
+            if remarks is not None:
                 sent = False
 
-                if {"lat", "lon"}.issubset(aircraft):
+                if "lat" in aircraft and "lon" in aircraft:
                     distance = PiAware.Helpers.to_kilometers(
-                        PiAware.Helpers.haversine_distance(
-                            PiAware.get_receiver_position(),
-                            Position(aircraft["lat"], aircraft["lon"]),
-                        )
+                        distance_to(aircraft["lat"], aircraft["lon"])
                     )
                 else:
                     distance = "unknown"
@@ -422,7 +679,7 @@ class PiAware:
                     squawk = "unknown"
 
                 sent = PiAware.Helpers.send_slack_notification(
-                    aircraft["hex"], flight, squawk, distance, "registration"
+                    aircraft["hex"], flight, squawk, distance, "registration", remarks
                 )
 
                 if sent is True:
@@ -430,25 +687,19 @@ class PiAware:
                         "Found Registration of Special Interest (%s) in %s km distance. Remarks: %s",
                         flight,
                         distance,
-                        REGISTRATION_OF_SPECIAL_INTEREST[flight],
+                        remarks,
                     )
 
-        if "hex" in aircraft and len(ICAO_OF_SPECIAL_INTEREST) >= 1:
+        if "hex" in aircraft:
             hex = PiAware.Helpers.trim(aircraft["hex"]).upper()
+            remarks = ICAO_WATCHLIST.get(hex)
 
-            contains_icao = PiAware.Helpers.contains_any(
-                hex, list(ICAO_OF_SPECIAL_INTEREST.keys())
-            )
-
-            if contains_icao is True:
+            if remarks is not None:
                 sent = False
 
-                if {"lat", "lon"}.issubset(aircraft):
+                if "lat" in aircraft and "lon" in aircraft:
                     distance = PiAware.Helpers.to_kilometers(
-                        PiAware.Helpers.haversine_distance(
-                            PiAware.get_receiver_position(),
-                            Position(aircraft["lat"], aircraft["lon"]),
-                        )
+                        distance_to(aircraft["lat"], aircraft["lon"])
                     )
                 else:
                     distance = "unknown"
@@ -464,7 +715,7 @@ class PiAware:
                     squawk = "unknown"
 
                 sent = PiAware.Helpers.send_slack_notification(
-                    hex, flight, squawk, distance, "icao"
+                    hex, flight, squawk, distance, "icao", remarks
                 )
 
                 if sent is True:
@@ -472,56 +723,59 @@ class PiAware:
                         "Found Flight of Special Interest (hex:%s) in %s km distance. Remarks: %s",
                         hex.lower(),
                         distance,
-                        ICAO_OF_SPECIAL_INTEREST[hex.upper()],
+                        remarks,
                     )
 
     @staticmethod
-    def __has_emergency(current_status: str, mode: str = "slug") -> Union[int, str]:
+    def __has_emergency(
+        current_status: str,
+        emergencies: Union[list, None],
+        mode: str = "slug",
+    ) -> Union[int, str]:
+        """
+        Notify about Aircrafts squawking an Emergency
+
+        `emergencies` are the Aircrafts found by `scan`, None if there was
+        no Aircraft List to look at.
+        """
         PiAware.Helpers.check_supported(mode, ["slug", "count"])
 
         emergency = 0
-        aircrafts = PiAware.get_aircrafts(raw=True)
-        if "aircraft" in aircrafts:
-            origin = PiAware.get_receiver_position()
+        if emergencies is not None:
+            distance_to = PiAware.Helpers.haversine_from(
+                PiAware.get_receiver_position()
+            )
 
-            for aircraft in aircrafts["aircraft"]:
-                if "squawk" in aircraft:
-                    contains = PiAware.Helpers.contains_any(
-                        aircraft["squawk"], list(EMERGENCY_SQUAWK.keys())
+            for aircraft in emergencies:
+                emergency += 1
+                if "flight" in aircraft:
+                    flight = PiAware.Helpers.trim(aircraft["flight"])
+                else:
+                    flight = "unknown"
+
+                if "lat" in aircraft and "lon" in aircraft:
+                    aircraft_distance = PiAware.Helpers.to_kilometers(
+                        distance_to(aircraft["lat"], aircraft["lon"])
                     )
-                    if contains:
-                        emergency += 1
-                        if "flight" in aircraft:
-                            flight = PiAware.Helpers.trim(aircraft["flight"])
-                        else:
-                            flight = "unknown"
-
-                        if {"lat", "lon"}.issubset(aircraft):
-                            aircraft_distance = PiAware.Helpers.to_kilometers(
-                                PiAware.Helpers.haversine_distance(
-                                    pos1=origin,
-                                    pos2=Position(aircraft["lat"], aircraft["lon"]),
-                                )
-                            )
-                        else:
-                            aircraft_distance = "unknown"
-
-                        notification_sent = PiAware.Helpers.send_slack_notification(
-                            aircraft["hex"],
-                            flight,
-                            aircraft["squawk"],
-                            aircraft_distance,
-                            "emergency",
-                        )
+                else:
+                    aircraft_distance = "unknown"
+
+                notification_sent = PiAware.Helpers.send_slack_notification(
+                    aircraft["hex"],
+                    flight,
+                    aircraft["squawk"],
+                    aircraft_distance,
+                    "emergency",
+                )
 
-                        logging.warning(
-                            "Aircraft %s (Callsign %s) with ICAO Emergency Squawk %s found in %s km distance (Notification sent %s)",
-                            aircraft["hex"],
-                            flight,
-                            aircraft["squawk"],
-                            aircraft_distance,
-                            notification_sent,
-                        )
+                logging.warning(
+                    "Aircraft %s (Callsign %s) with ICAO Emergency Squawk %s found in %s km distance (Notification sent %s)",
+                    aircraft["hex"],
+                    flight,
+                    aircraft["squawk"],
+                    aircraft_distance,
+                    notification_sent,
+                )
         else:
             emergency = 666
 
@@ -540,14 +794,7 @@ class PiAware:
         """
         Get the PiAware Status json
         """
-        r = PiAware.Helpers.download(f"{PIAWARE_HOST}/status.json")
-
-        if r is not False and r:
-            res = r.json()
-        else:
-            res = {}
-
-        return res
+        return PiAware.Helpers.download_json(f"{PIAWARE_HOST}/status.json")
 
     @staticmethod
     def get_receiver() -> list:
@@ -556,33 +803,37 @@ class PiAware:
 
         The json contains fields like Receiver Position
         """
-        r = PiAware.Helpers.download(f"{PIAWARE_HOST}/skyaware/data/receiver.json")
-
-        if r is not False:
-            res = r.json()
-        else:
-            res = {}
-
-        return res
+        return PiAware.Helpers.download_json(
+            f"{PIAWARE_HOST}/skyaware/data/receiver.json"
+        )
 
     @staticmethod
     def get_receiver_position() -> Position:
         """
         Return the Receiver Position from receiver.json
 
-        If Position was set during Setup the pre-received Position
-        is returned as the receiver is unlikely to move during Runtime
-        of the Script.
+        Once a Position was received it is kept for RECEIVER_POSITION_TTL
+        Seconds before receiver.json is asked again, so a relocated Receiver
+        is picked up eventually. If that fails the known Position is kept.
+        The Fallback (0, 0) is never kept, so the next Call tries again.
         """
-        if isinstance(PiAware.receiver_position, Position):
-            logging.debug("Found own %s", PiAware.receiver_position)
+        now = time.monotonic()
+        known = PiAware.receiver_position
 
-            return PiAware.receiver_position
+        if isinstance(known, Position) and now < PiAware.receiver_position_expires:
+            logging.debug("Found own %s", known)
+
+            return known
 
         receiver = PiAware.get_receiver()
         if {"lat", "lon"}.issubset(receiver):
             origin = Position(receiver["lat"], receiver["lon"])
+            PiAware.receiver_position = origin
+            PiAware.receiver_position_expires = now + RECEIVER_POSITION_TTL
             logging.debug("Own %s", origin)
+        elif isinstance(known, Position):
+            origin = known
+            logging.warning("Could not refresh own Location. Keeping own %s", origin)
         else:
             origin = Position(0.000, 0.000)
             logging.error("Could not get own Location. Own %s", origin)
@@ -590,55 +841,82 @@ class PiAware:
         return origin
 
     @staticmethod
-    def get_aircrafts(
-        pos: bool = True, mode: str = "adsb", threshold: int = 120, raw: bool = False
-    ) -> Union[list, int]:
+    def get_aircrafts_raw() -> dict:
+        """
+        Get the PiAware aircraft.json (unfiltered)
+
+        Fetched once per Refresh and passed to `scan` as `data`.
+        """
+        return PiAware.Helpers.download_json(
+            f"{PIAWARE_HOST}/skyaware/data/aircraft.json"
+        )
+
+    @staticmethod
+    def scan(data: dict, origin: Position, threshold: int = 120) -> AircraftScan:
         """
-        Return a List of Aircrafts currently seen by the Receiver
+        Collect Counts, Range and Emergencies of a pre-fetched aircraft.json
+        in a single Pass over all Aircrafts
 
-        The List is subject to filtering (mode, position, age) if needed
+        Aircrafts with a Position are checked for Special Interest as well.
+        `emergencies` is None if the Payload holds no Aircraft List at all.
         """
+        count_all, count_pos, count_mlat = 0, 0, 0
+        min_hav, max_hav = None, None
+        emergencies = []
 
-        PiAware.Helpers.check_supported(mode, ["adsb", "mlat"])
+        hav_to = PiAware.Helpers.haversine_hav_from(origin)
+        distance_to = PiAware.Helpers.haversine_from(origin)
 
-        res = []
-        r = PiAware.Helpers.download(f"{PIAWARE_HOST}/skyaware/data/aircraft.json")
+        for aircraft in data.get("aircraft", []):
+            if "seen" in aircraft and aircraft["seen"] <= threshold:
+                count_all += 1
 
-        if r is not False:
-            json = r.json()
-        else:
-            json = {}
+            if "seen_pos" in aircraft and aircraft["seen_pos"] <= threshold:
+                count_pos += 1
 
-        if "aircraft" in json:
-            if raw is True:
-                return json
+                if "lat" in aircraft and "lon" in aircraft:
+                    hav = hav_to(aircraft["lat"], aircraft["lon"])
 
-            for aircraft in json["aircraft"]:
-                if mode == "adsb":
-                    if pos is True:
-                        if "seen_pos" in aircraft and aircraft["seen_pos"] <= threshold:
-                            res.append(aircraft)
+                    if min_hav is None or hav < min_hav:
+                        min_hav = hav
+                    if max_hav is None or hav > max_hav:
+                        max_hav = hav
 
-                            PiAware.__process_special_interest(aircraft)
-                    else:
-                        if "seen" in aircraft and aircraft["seen"] <= threshold:
-                            res.append(aircraft)
-                elif mode == "mlat":
-                    if "mlat" in aircraft and "lat" in aircraft["mlat"]:
-                        res.append(aircraft)
-                else:
-                    logging.warning("Unknown Mode: %s", mode)
+                PiAware.__process_special_interest(aircraft, distance_to)
+
+            if "mlat" in aircraft and "lat" in aircraft["mlat"]:
+                count_mlat += 1
+
+            if aircraft.get("squawk") in EMERGENCY_SQUAWK:
+                emergencies.append(aircraft)
+
+        if min_hav is None:
+            min_range, max_range = sys.maxsize, 0
+        else:
+            min_range = PiAware.Helpers.hav_to_distance(min_hav)
+            max_range = PiAware.Helpers.hav_to_distance(max_hav)
 
-        ac_count = len(res)
         logging.info(
-            "Found %s total Flights (Position: %s, Mode: %s, Threshold: %ss)",
-            ac_count,
-            pos,
-            mode,
+            "Found %s total Flights (Position: %s, MLAT: %s, Threshold: %ss)",
+            count_all,
+            count_pos,
+            count_mlat,
             threshold,
         )
+        logging.info(
+            "Min Aircraft Distance: %s km, Max Aircraft Distance: %s km",
+            PiAware.Helpers.to_kilometers(min_range, 2),
+            PiAware.Helpers.to_kilometers(max_range, 2),
+        )
 
-        return ac_count
+        return AircraftScan(
+            count_all,
+            count_pos,
+            count_mlat,
+            min_range,
+            max_range,
+            emergencies if "aircraft" in data else None,
+        )
 
     @staticmethod
     def get_fr24_status() -> str:
@@ -647,12 +925,7 @@ class PiAware:
 
         It's returned as a "side information", focus is on PiAware
         """
-        r = PiAware.Helpers.download(f"{FLIGHTRADAR_HOST}/monitor.json", 2, 0.1)
-
-        if r is not False:
-            fr24 = r.json()
-        else:
-            fr24 = {}
+        fr24 = PiAware.Helpers.download_json(f"{FLIGHTRADAR_HOST}/monitor.json")
 
         if "feed_status" in fr24 and fr24["feed_status"] == "connected":
             status = f'Connected via {fr24["feed_current_mode"]}'
@@ -672,17 +945,21 @@ class PiAware:
         """
         time_start = time.time()
 
-        font_path = os.path.join(PATH_ROOT, "epaper.ttf")
-        font_s = ImageFont.truetype(font_path, 11)
-        font_m = ImageFont.truetype(font_path, 12)
+        font_s, font_m = PiAware.Helpers.load_fonts()
 
         try:
             error = False
-            status = PiAware.get_status()
+            enable_fr24 = PiAware.Helpers.bool_from_env("ENABLE_FR24")
+
+            calls = [PiAware.get_status, PiAware.get_aircrafts_raw]
+            if enable_fr24:
+                calls.append(PiAware.get_fr24_status)
+
+            status, aircrafts, *fr24 = PiAware.Helpers.fetch_concurrently(*calls)
             status_slug = "OK"
 
-            if PiAware.Helpers.bool_from_env("ENABLE_FR24"):
-                status_slug = f"{status_slug}, fr24: {PiAware.get_fr24_status()}"
+            if enable_fr24:
+                status_slug = f"{status_slug}, fr24: {fr24[0]}"
 
             if "system_uptime" in status:
                 uptime = str(timedelta(seconds=status["system_uptime"]))
@@ -719,59 +996,59 @@ class PiAware:
             if error is True:
                 status_slug = "NEEDS ATTENTION"
 
-            status_slug = PiAware.__has_emergency(current_status=status_slug)
+            ths = 120
+            origin = PiAware.get_receiver_position()
+            summary = PiAware.scan(data=aircrafts, origin=origin, threshold=ths)
+
+            status_slug = PiAware.__has_emergency(
+                current_status=status_slug, emergencies=summary.emergencies
+            )
 
             clear_display = bool(cycle == 1)
 
+            PiAware.updating_display = True
             epd = PiAware.__clear(clear=clear_display, sleep=False)
 
             logging.debug(
                 "e-Paper Display is %sx%s (Height x Width)", epd.height, epd.width
             )
 
-            ep_image = Image.new("1", (epd.height, epd.width), 255)
+            ep_image = PiAware.Helpers.load_template((epd.height, epd.width)).copy()
             draw = ImageDraw.Draw(ep_image)
 
-            draw.line((0, 88, 264, 88), fill=0)
-            draw.line((132, 88, 132, 176), fill=0)
-
             draw.text((4, 4), f"Status ({status_slug})", font=font_s, fill=0)
             draw.text((8, 20), status_time, font=font_m, fill=0)
             draw.text((8, 35), status_piaware, font=font_m, fill=0)
             draw.text((8, 50), status_gps, font=font_m, fill=0)
             draw.text((8, 65), status_radio, font=font_m, fill=0)
 
-            origin = PiAware.get_receiver_position()
-
-            ths = 120
-            draw.text((4, 90), "Aircrafts", font=font_s, fill=0)
             draw.text(
                 (8, 103),
-                f"Count (all): {PiAware.get_aircrafts(pos=False, threshold=ths)}",
+                f"Count (all): {summary.count_all}",
                 font=font_m,
                 fill=0,
             )
             draw.text(
                 (8, 116),
-                f"Count (w/ pos): {PiAware.get_aircrafts(pos=True, threshold=ths)}",
+                f"Count (w/ pos): {summary.count_pos}",
                 font=font_m,
                 fill=0,
             )
             draw.text(
                 (8, 129),
-                f'Count (MLAT): {PiAware.get_aircrafts(pos=True, mode="mlat", threshold=ths)}',
+                f"Count (MLAT): {summary.count_mlat}",
                 font=font_m,
                 fill=0,
             )
             draw.text(
                 (8, 142),
-                f'Min Range: {PiAware.Helpers.to_kilometers(PiAware.Helpers.distance(origin=origin, mode="min", threshold=ths), 1)} km',
+                f"Min Range: {PiAware.Helpers.to_kilometers(summary.min_range, 1)} km",
                 font=font_m,
                 fill=0,
             )
             draw.text(
                 (8, 155),
-                f'Max Range: {PiAware.Helpers.to_kilometers(PiAware.Helpers.distance(origin=origin, mode="max", threshold=ths), 1)} km',
+                f"Max Range: {PiAware.Helpers.to_kilometers(summary.max_range, 1)} km",
                 font=font_m,
                 fill=0,
             )
@@ -788,7 +1065,6 @@ class PiAware:
 
             local_ip = PiAware.Helpers.get_local_ip()
 
-            draw.text((136, 90), "Receiver OS", font=font_s, fill=0)
             draw.text((140, 103), f"Up: {uptime}", font=font_m, fill=0)
             draw.text((140, 116), f"CPU Load: {status_load}%", font=font_m, fill=0)
             draw.text((140, 129), f"CPU Temp: {status_temp}°C", font=font_m, fill=0)
@@ -798,9 +1074,16 @@ class PiAware:
 
             epd.display(epd.getbuffer(ep_image))
             epd.sleep()
+            PiAware.epd_sleeping = True
+            PiAware.updating_display = False
 
-            if not RUNNING_IN_DOCKER:
-                ep_image.save(os.path.join(PATH_ROOT, "epaper.jpg"))
+            save_every = SAVE_SNAPSHOT_EVERY
+            if not RUNNING_IN_DOCKER and save_every and cycle % save_every == 0:
+                threading.Thread(
+                    target=ep_image.save,
+                    args=(os.path.join(PATH_ROOT, "epaper.jpg"),),
+                    daemon=True,
+                ).start()
 
             new_cycle = cycle + 1
 
@@ -813,7 +1096,7 @@ class PiAware:
             return new_cycle
         except IOError as e:
             logging.error(e)
-            PiAware.__shutdown(signal_number=15)
+            PiAware.shutdown_requested = True
 
     @staticmethod
     def process() -> None:
@@ -822,32 +1105,47 @@ class PiAware:
         """
         cycle = 1
 
-        while True:
-            logging.info("Starting Refresh Cycle %s", cycle)
+        try:
+            while True:
+                logging.info("Starting Refresh Cycle %s", cycle)
 
-            current_cycle = cycle
-            cycle = PiAware.refresh(cycle=current_cycle)
+                current_cycle = cycle
+
+                try:
+                    cycle = PiAware.refresh(cycle=current_cycle)
+                finally:
+                    PiAware.updating_display = False
+
+                if PiAware.shutdown_requested:
+                    logging.info("Shutting down after refresh cycle %s", current_cycle)
+                    sys.exit(0)
+
+                sleepy_display = 300
+                sleepy_updates = round(sleepy_display / 10)
+                logging.info(
+                    "Sleeping for %s seconds after refresh cycle %s (Ping every %ss)",
+                    sleepy_display,
+                    current_cycle,
+                    sleepy_updates,
+                )
+
+                for slept in range(sleepy_updates, sleepy_display + 1, sleepy_updates):
+                    if PiAware.__wait_for_buttons(sleepy_updates):
+                        logging.info(
+                            "Woke up early after refresh cycle %s", current_cycle
+                        )
+                        break
 
-            i = 0
-            sleepy_display = 300
-            sleepy_updates = round(sleepy_display / 10)
-            logging.info(
-                "Sleeping for %s seconds after refresh cycle %s (Ping every %ss)",
-                sleepy_display,
-                current_cycle,
-                sleepy_updates,
-            )
-            while i < sleepy_display:
-                time.sleep(1)
-                i += 1
-                if i % sleepy_updates == 0:
                     logging.info(
                         "Slept %s/%s seconds after refresh cycle %s",
-                        i,
+                        slept,
                         sleepy_display,
                         current_cycle,
                     )
 
+        finally:
+            PiAware.__cleanup()
+
     @staticmethod
     def setup() -> None:
         """
@@ -862,7 +1160,9 @@ class PiAware:
         logging.info("Running on PID: %s", os.getpid())
 
         if SENTRY_DSN is not None and PiAware.Helpers.is_valid_url(SENTRY_DSN):
-            sentry_sdk.init(dsn=SENTRY_DSN, traces_sample_rate=1.0)
+            sentry_sdk.init(
+                dsn=SENTRY_DSN, traces_sample_rate=float(SENTRY_TRACES_SAMPLE_RATE)
+            )
             logging.info("Sentry SDK is Enabled")
         else:
             logging.info(
@@ -872,27 +1172,38 @@ class PiAware:
         if PIAWARE_HOST is None:
             raise RuntimeError("Environment Variable PIAWARE_HOST is not set.")
 
-        PiAware.receiver_position = PiAware.get_receiver_position()
+        # Mounted in this Order so PiAware's Retries win if both share a Host
+        PiAware.Helpers.mount_adapter(FLIGHTRADAR_HOST, 2, 0.1)
+        PiAware.Helpers.mount_adapter(
+            PIAWARE_HOST, int(PIAWARE_RETRIES), float(PIAWARE_BACKOFF)
+        )
+
+        PiAware.get_receiver_position()
+
+        PiAware.button_handlers = {
+            5: (
+                "Clearing Display (Black)",
+                lambda: PiAware.__clear(clear=True, sleep=False, display_color=0x00),
+            ),
+            6: (
+                "Clearing Display (White)",
+                lambda: PiAware.__clear(clear=True, sleep=False, display_color=0xFF),
+            ),
+            13: ("Executing Refresh", lambda: True),
+            19: ("Executing Shutdown", lambda: os.kill(os.getpid(), signal.SIGTERM)),
+        }
 
         GPIO.setmode(GPIO.BCM)
 
-        GPIO.setup(5, GPIO.IN, pull_up_down=GPIO.PUD_UP)
-        GPIO.setup(6, GPIO.IN, pull_up_down=GPIO.PUD_UP)
-        GPIO.setup(13, GPIO.IN, pull_up_down=GPIO.PUD_UP)
-        GPIO.setup(19, GPIO.IN, pull_up_down=GPIO.PUD_UP)
+        GPIO.setup(list(BUTTON_PINS), GPIO.IN, pull_up_down=GPIO.PUD_UP)
 
-        GPIO.add_event_detect(
-            5, GPIO.FALLING, callback=PiAware.__process_interrupt, bouncetime=200
-        )
-        GPIO.add_event_detect(
-            6, GPIO.FALLING, callback=PiAware.__process_interrupt, bouncetime=200
-        )
-        GPIO.add_event_detect(
-            13, GPIO.FALLING, callback=PiAware.__process_interrupt, bouncetime=200
-        )
-        GPIO.add_event_detect(
-            19, GPIO.FALLING, callback=PiAware.__process_interrupt, bouncetime=200
-        )
+        for pin in BUTTON_PINS:
+            GPIO.add_event_detect(
+                pin,
+                GPIO.FALLING,
+                callback=PiAware.__button_callback(pin),
+                bouncetime=20,
+            )
 
         signal.signal(signal.SIGINT, PiAware.__process_shutdown_signal)
         signal.signal(signal.SIGQUIT, PiAware.__process_shutdown_signal)